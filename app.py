@@ -1,20 +1,46 @@
-from flask import Flask, request, jsonify, render_template, redirect, url_for, session, flash
+import time
+_import_started = time.perf_counter()  # Cold-start clock, taken before the heavy imports
+
+from flask import Flask, Blueprint, current_app, request, jsonify, render_template, redirect, url_for, session, flash
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
 import sqlite3
 from datetime import datetime, timedelta
 import os
 import hashlib
 
-app = Flask(__name__)
-app.secret_key = 'cafe-warehouse-secret-key-2025'  # Change this in production
-app.permanent_session_lifetime = timedelta(minutes=30)  # 30 minute sessions
+bp = Blueprint('warehouse', __name__)
 
-# Initialize Flask-Login
+# Initialize Flask-Login (bound to the app in create_app)
 login_manager = LoginManager()
-login_manager.init_app(app)
-login_manager.login_view = 'login'
+login_manager.login_view = 'warehouse.login'
 login_manager.login_message = 'Please log in to access this page.'
 
+def create_app(config=None):
+    """
+    Application factory used by both the dev server and the production WSGI server.
+    Server tuning can be set through environment variables or the config mapping:
+        WAREHOUSE_HOST, WAREHOUSE_PORT, WAREHOUSE_WORKERS, WAREHOUSE_THREADS
+    """
+    app = Flask(__name__)
+    app.secret_key = os.environ.get('WAREHOUSE_SECRET_KEY', 'cafe-warehouse-secret-key-2025')  # Change this in production
+    app.permanent_session_lifetime = timedelta(minutes=30)  # 30 minute sessions
+    
+    app.config.update(
+        SERVER_HOST=os.environ.get('WAREHOUSE_HOST', '0.0.0.0'),
+        SERVER_PORT=int(os.environ.get('WAREHOUSE_PORT', 5000)),
+        SERVER_WORKERS=int(os.environ.get('WAREHOUSE_WORKERS', min(2 * (os.cpu_count() or 1) + 1, 8))),
+        SERVER_THREADS=int(os.environ.get('WAREHOUSE_THREADS', 4)),
+    )
+    if config:
+        app.config.update(config)
+    
+    login_manager.init_app(app)
+    app.register_blueprint(bp)
+    
+    # Time from interpreter import of this module to a fully built app
+    app.config['COLD_START_MS'] = round((time.perf_counter() - _import_started) * 1000, 1)
+    return app
+
 def hash_password(password):
     """Hash a password using SHA-256"""
     return hashlib.sha256(password.encode()).hexdigest()
@@ -54,7 +80,7 @@ def get_db_connection():
     conn.row_factory = sqlite3.Row  # This allows us to access columns by name
     return conn
 
-@app.route('/login', methods=['GET', 'POST'])
+@bp.route('/login', methods=['GET', 'POST'])
 def login():
     """Handle user login"""
     if request.method == 'POST':
@@ -84,7 +110,7 @@ def login():
             session.permanent = True
             
             flash(f'Welcome back, {user.full_name}!', 'success')
-            return redirect(url_for('index'))
+            return redirect(url_for('warehouse.index'))
         else:
             flash('Invalid username or password', 'error')
         
@@ -92,21 +118,21 @@ def login():
     
     return render_template('login.html')
 
-@app.route('/logout')
+@bp.route('/logout')
 @login_required
 def logout():
     """Handle user logout"""
     logout_user()
     flash('You have been logged out successfully', 'info')
-    return redirect(url_for('login'))
+    return redirect(url_for('warehouse.login'))
 
-@app.route('/')
+@bp.route('/')
 @login_required
 def index():
     """Serve the main dashboard page"""
     return render_template('index.html')
 
-@app.route('/log_transaction', methods=['POST'])
+@bp.route('/log_transaction', methods=['POST'])
 @login_required
 def log_transaction():
     """
@@ -205,7 +231,7 @@ def log_transaction():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/dashboard', methods=['GET'])
+@bp.route('/dashboard', methods=['GET'])
 @login_required
 def dashboard():
     """
@@ -310,7 +336,7 @@ def dashboard():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/products/<int:department_id>', methods=['GET'])
+@bp.route('/products/<int:department_id>', methods=['GET'])
 @login_required
 def get_products_by_department(department_id):
     """Get all products for a specific department with their current stock"""
@@ -351,7 +377,7 @@ def get_products_by_department(department_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/users', methods=['GET'])
+@bp.route('/users', methods=['GET'])
 @login_required
 def get_users():
     """Get all users (manager only)"""
@@ -390,7 +416,7 @@ def get_users():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/users', methods=['POST'])
+@bp.route('/users', methods=['POST'])
 @login_required
 def create_user():
     """Create a new user (manager only)"""
@@ -448,7 +474,7 @@ def create_user():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/user-info', methods=['GET'])
+@bp.route('/user-info', methods=['GET'])
 @login_required
 def get_current_user_info():
     """Get current user information"""
@@ -461,12 +487,20 @@ def get_current_user_info():
         'is_manager': current_user.is_manager()
     })
 
+@bp.route('/healthz', methods=['GET'])
+def healthz():
+    """Lightweight health check for load balancers and process managers (no login, no database)"""
+    return jsonify({
+        'status': 'ok',
+        'cold_start_ms': current_app.config['COLD_START_MS']
+    })
+
 # Error handlers
-@app.errorhandler(404)
+@bp.app_errorhandler(404)
 def not_found(error):
     return jsonify({'error': 'Endpoint not found'}), 404
 
-@app.errorhandler(500)
+@bp.app_errorhandler(500)
 def internal_error(error):
     return jsonify({'error': 'Internal server error'}), 500
 
@@ -476,11 +510,15 @@ if __name__ == '__main__':
         print("❌ Database not found! Please run 'python database.py' first.")
         exit(1)
     
-    print("🚀 Starting Cafe Warehouse Management System...")
+    app = create_app()
+    
+    print("🚀 Starting Cafe Warehouse Management System (development server)...")
     print("📱 Access the dashboard at: http://localhost:5000")
     print("📊 API endpoints available:")
     print("   - GET  /dashboard (get all inventory and profit data)")
     print("   - POST /log_transaction (log imports/sales)")
     print("   - GET  /products/<department_id> (get products by department)")
+    print("   - GET  /healthz (health check)")
+    print("💡 For production use run: python serve.py")
     
     app.run(debug=True, host='0.0.0.0', port=5000)
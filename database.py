@@ -6,6 +6,17 @@ def hash_password(password):
     """Hash a password using SHA-256"""
     return hashlib.sha256(password.encode()).hexdigest()
 
+REQUIRED_TABLES = ('departments', 'products', 'users', 'inventory_transactions')
+
+def check_schema(db_path='warehouse.db'):
+    """Return the list of required tables missing from the database (empty if the schema is complete)"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    existing = {row[0] for row in cursor.fetchall()}
+    conn.close()
+    return [table for table in REQUIRED_TABLES if table not in existing]
+
 def create_database():
     """Create the database and tables for the Cafe Warehouse Management System v2.0"""
     
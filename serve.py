@@ -0,0 +1,72 @@
+import time
+_process_started = time.perf_counter()  # Cold-start clock for the whole server process
+
+import os
+import sys
+
+from app import create_app
+from database import check_schema
+
+def report_cold_start(app):
+    """Record and print the time from process start until the server is ready to accept requests"""
+    cold_start_ms = round((time.perf_counter() - _process_started) * 1000, 1)
+    app.config['COLD_START_MS'] = cold_start_ms
+    print(f"⏱️  Cold start: {cold_start_ms} ms")
+
+def run_gunicorn(app):
+    """Run the preloaded app under gunicorn with multiple worker processes, each with a thread pool"""
+    from gunicorn.app.base import BaseApplication
+
+    class WarehouseServer(BaseApplication):
+        def __init__(self, application, options):
+            self.application = application
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return self.application
+
+    options = {
+        'bind': f"{app.config['SERVER_HOST']}:{app.config['SERVER_PORT']}",
+        'workers': app.config['SERVER_WORKERS'],
+        'threads': app.config['SERVER_THREADS'],
+        'worker_class': 'gthread',
+        'preload_app': True,
+        # Runs in the master before workers are forked, so they inherit the measured value
+        'when_ready': lambda server: report_cold_start(app),
+    }
+    WarehouseServer(app, options).run()
+
+def run_waitress(app):
+    """Run the app under waitress (single process, multi-threaded) - used on Windows where gunicorn is unavailable"""
+    from waitress import serve
+
+    report_cold_start(app)
+    serve(app, host=app.config['SERVER_HOST'], port=app.config['SERVER_PORT'],
+          threads=app.config['SERVER_WORKERS'] * app.config['SERVER_THREADS'])
+
+if __name__ == '__main__':
+    # Check the database once here so forked workers don't repeat it
+    if not os.path.exists('warehouse.db'):
+        print("❌ Database not found! Please run 'python database.py' first.")
+        sys.exit(1)
+
+    missing_tables = check_schema('warehouse.db')
+    if missing_tables:
+        print(f"❌ Database schema is incomplete (missing: {', '.join(missing_tables)}). Please run 'python database.py'.")
+        sys.exit(1)
+
+    app = create_app()
+
+    print("🚀 Starting Cafe Warehouse Management System (production server)...")
+    print(f"📱 Listening on: http://{app.config['SERVER_HOST']}:{app.config['SERVER_PORT']}")
+    print(f"⚙️  Workers: {app.config['SERVER_WORKERS']}, threads per worker: {app.config['SERVER_THREADS']}")
+
+    if os.name == 'nt':
+        run_waitress(app)
+    else:
+        run_gunicorn(app)
@@ -1,4 +1,6 @@
 @echo off
+REM Usage: start.bat             (development server)
+REM        start.bat production  (multi-threaded production server)
 echo 🚀 Starting Cafe Warehouse Management System...
 echo.
 
@@ -11,9 +13,14 @@ if not exist "venv" (
 REM Activate virtual environment
 call venv\Scripts\activate.bat
 
-REM Install requirements
-echo Installing dependencies...
-pip install -r requirements.txt
+REM Install requirements (skipped when requirements.txt is unchanged since the last install)
+fc /b requirements.txt venv\.requirements.installed >nul 2>&1
+if errorlevel 1 (
+    echo Installing dependencies...
+    pip install -r requirements.txt && copy /y requirements.txt venv\.requirements.installed >nul
+) else (
+    echo Dependencies up to date.
+)
 
 REM Check if database exists, create if not
 if not exist "warehouse.db" (
@@ -27,6 +34,10 @@ echo ✅ Starting the application...
 echo 📱 Open your browser and go to: http://localhost:5000
 echo 🛑 Press Ctrl+C to stop the server
 echo.
-python app.py
+if "%1"=="production" (
+    python serve.py
+) else (
+    python app.py
+)
 
 pause
@@ -1,4 +1,6 @@
 #!/bin/bash
+# Usage: ./start.sh             (development server)
+#        ./start.sh production  (multi-worker production server)
 
 echo "🚀 Starting Cafe Warehouse Management System..."
 echo
@@ -12,9 +14,13 @@ fi
 # Activate virtual environment
 source venv/bin/activate
 
-# Install requirements
-echo "Installing dependencies..."
-pip install -r requirements.txt
+# Install requirements (skipped when requirements.txt is unchanged since the last install)
+if cmp -s requirements.txt venv/.requirements.installed; then
+    echo "Dependencies up to date."
+else
+    echo "Installing dependencies..."
+    pip install -r requirements.txt && cp requirements.txt venv/.requirements.installed
+fi
 
 # Check if database exists, create if not
 if [ ! -f "warehouse.db" ]; then
@@ -28,4 +34,8 @@ echo "✅ Starting the application..."
 echo "📱 Open your browser and go to: http://localhost:5000"
 echo "🛑 Press Ctrl+C to stop the server"
 echo
-python app.py
+if [ "$1" = "production" ]; then
+    python serve.py
+else
+    python app.py
+fi